@@ -26,45 +26,128 @@ Dependencies:
 - Python 3.6 or higher
 - `random` package (built-in)
 - `matplotlib` package (install with `pip install matplotlib`)
+- `numpy` package (optional, install with `pip install numpy`)
+- `numba` package (optional, install with `pip install numba`)
+- `_monty` C extension (optional, build with `python setup.py build_ext --inplace`)
+- `scipy` package (optional, install with `pip install scipy`)
+- `cupy` package (optional, install with e.g. `pip install cupy-cuda12x`)
 - `argparse` package (built-in)
 """
 
 import random
-import matplotlib.pyplot as plt
 import argparse
+import math
+import multiprocessing
+import os
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure-Python loop.
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to the NumPy or pure-Python path.
+    njit = None
+
+try:
+    from _monty import monty_hall_count
+except ImportError:  # The C extension is optional; build it with `python setup.py build_ext --inplace`.
+    monty_hall_count = None
+
+try:
+    import cupy as cp
+except ImportError:  # CuPy is optional; large runs stay on the CPU paths.
+    cp = None
+
+# Shared PCG64 generator for unseeded runs, so each call skips gathering fresh OS entropy.
+_RNG = np.random.default_rng(np.random.SeedSequence()) if np is not None else None
+
+if njit is not None:
+    def _build_kernel(fixed_doors=0):
+        """Compiles the trial loop, folding in fixed_doors as a constant door count when it is non-zero."""
+        @njit(cache=True)
+        def kernel(num_trials, num_doors, switch_doors, seed):
+            """Counts the wins over num_trials games in compiled code, reseeding Numba's RNG from seed first."""
+            doors = fixed_doors if fixed_doors else num_doors
+            np.random.seed(seed)
+            wins = 0
+            for _ in range(num_trials):
+                car_door = np.random.randint(0, doors)
+                player_choice = np.random.randint(0, doors)
+                # XOR turns a stay win into a switch loss (and vice versa) without branching.
+                wins += np.int64(player_choice == car_door) ^ np.int64(switch_doors)
+            return wins
+        return kernel
+
+    _monty_kernel = _build_kernel()
+    # The menu only offers these door counts, so each gets a constant-folded kernel. They run only
+    # when _monty is not built: the C extension is checked first, and it is faster at every count.
+    _MONTY_KERNELS = {num_doors: _build_kernel(num_doors) for num_doors in (3, 10, 1000)}
+else:
+    _monty_kernel = None
+    _MONTY_KERNELS = {}
+
+PARALLEL_MIN_TRIALS = 1_000_000  # Below this, starting worker processes costs more than it saves.
+GPU_MIN_TRIALS = 1_000_000  # Below this, kernel launches and transfers cost more than the GPU saves.
+NUMPY_BLOCK_TRIALS = 1 << 18  # The NumPy path plays this many games per block, so its arrays stay in cache.
+
+def _count_wins(num_trials, num_doors, switch_doors, seed):
+    """Plays num_trials games in this process and returns the number of wins."""
+    if cp is not None and num_trials >= GPU_MIN_TRIALS:
+        # Every game is independent, so the GPU plays them all at once.
+        gpu_rng = cp.random.default_rng(seed)
+        car_doors = gpu_rng.integers(0, num_doors, size=num_trials, dtype=cp.int32)
+        player_choices = gpu_rng.integers(0, num_doors, size=num_trials, dtype=cp.int32)
+        stay_wins = int(cp.count_nonzero(car_doors == player_choices))
+        return num_trials - stay_wins if switch_doors else stay_wins
+
+    if monty_hall_count is not None:
+        return monty_hall_count(num_trials, num_doors, switch_doors, seed)
+
+    if _monty_kernel is not None:
+        # Numba keeps one RNG per process, so an unseeded run still reseeds it, from OS
+        # entropy, rather than continuing from whatever a seeded run left behind.
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little")
+        return _MONTY_KERNELS.get(num_doors, _monty_kernel)(num_trials, num_doors, switch_doors, seed)
+
+    if np is not None:
+        # Monty leaves only one other door closed, so switching wins exactly
+        # when the first pick was wrong.
+        rng = _RNG if seed is None else np.random.default_rng(seed)
+        # Keep each door in its own int32 column and play the games in blocks,
+        # comparing the columns into one reused buffer.
+        matches = np.empty(min(num_trials, NUMPY_BLOCK_TRIALS), dtype=bool)
+        stay_wins = 0
+        for start in range(0, num_trials, NUMPY_BLOCK_TRIALS):
+            size = min(NUMPY_BLOCK_TRIALS, num_trials - start)
+            car_doors, player_choices = rng.integers(0, num_doors, size=(2, size), dtype=np.int32)
+            stay_wins += np.count_nonzero(np.equal(car_doors, player_choices, out=matches[:size]))
+        return num_trials - stay_wins if switch_doors else stay_wins
+
+    # Use a local generator: seeding it leaves the shared random module untouched.
+    loop_rng = random.Random(seed)
 
-def monty_hall_simulation(num_trials, num_doors, switch_doors):
-    """
-    Simulates the Monty Hall problem for a specified number of trials and doors.
-    In the extended version, Monty opens all doors except two: the player's initial 
-    choice and one other door. The remaining door is:
-      - The car door, if the player's initial pick was wrong.
-      - A random goat door, if the player's initial pick was the car.
-      
-    Args:
-        num_trials (int): Number of simulation runs.
-        num_doors (int): Number of doors in the simulation.
-        switch_doors (bool): If True, the player switches to the remaining door.
-        
-    Returns:
-        float: The win rate (wins / num_trials).
-    """
     wins = 0  # Counter for wins
 
     for _ in range(num_trials):
         # Randomly assign the car behind one of the doors (0 to num_doors-1)
-        car_door = random.randint(0, num_doors - 1)
+        car_door = loop_rng.randint(0, num_doors - 1)
 
         # Player makes an initial random choice
-        player_choice = random.randint(0, num_doors - 1)
+        player_choice = loop_rng.randint(0, num_doors - 1)
 
         if switch_doors:
             # In the extended Monty Hall, Monty opens all doors except two:
             # the player's door and one other door.
             if player_choice == car_door:
                 # If the player's initial pick is correct, Monty randomly leaves one goat door closed.
-                remaining_doors = [i for i in range(num_doors) if i != player_choice]
-                final_choice = random.choice(remaining_doors)
+                # Draw among the other num_doors - 1 doors and step past the player's door,
+                # instead of building a list of them on every trial.
+                final_choice = loop_rng.randrange(num_doors - 1)
+                if final_choice >= player_choice:
+                    final_choice += 1
             else:
                 # If the player's initial pick is wrong, Monty leaves the car door closed.
                 final_choice = car_door
@@ -75,13 +158,111 @@ def monty_hall_simulation(num_trials, num_doors, switch_doors):
         if final_choice == car_door:
             wins += 1
 
+    return wins
+
+def _count_wins_worker(chunk):
+    """Unpacks one chunk of trials for multiprocessing.Pool.map."""
+    return _count_wins(*chunk)
+
+def monty_hall_simulation(num_trials, num_doors, switch_doors, seed=None):
+    """
+    Simulates the Monty Hall problem for a specified number of trials and doors.
+    In the extended version, Monty opens all doors except two: the player's initial 
+    choice and one other door. The remaining door is:
+      - The car door, if the player's initial pick was wrong.
+      - A random goat door, if the player's initial pick was the car.
+      
+    Args:
+        num_trials (int): Number of simulation runs.
+        num_doors (int): Number of doors in the simulation.
+        switch_doors (bool): If True, the player switches to the remaining door.
+        seed (int, optional): Seed for the random number generator.
+        
+    Returns:
+        float: The win rate (wins / num_trials).
+    """
+    processes = os.cpu_count() or 1
+    # Runs big enough for the GPU path stay in one process, which keeps the GPU busy on its own.
+    if num_trials < PARALLEL_MIN_TRIALS or processes == 1 or cp is not None:
+        return _count_wins(num_trials, num_doors, switch_doors, seed) / num_trials
+
+    # Split the trials across processes, giving each chunk its own seed so the
+    # workers do not replay the same games.
+    seeder = random.Random(seed)
+    chunks = []
+    for chunk in range(processes):
+        chunk_trials = num_trials // processes + (chunk < num_trials % processes)
+        chunks.append((chunk_trials, num_doors, switch_doors, seeder.randrange(2 ** 32)))
+    with multiprocessing.Pool(processes) as pool:
+        wins = sum(pool.map(_count_wins_worker, chunks))
     return wins / num_trials
 
+def monty_hall_rates(num_trials, num_doors, seed=None):
+    """
+    Simulates the game once and scores both strategies on the same games.
+
+    Args:
+        num_trials (int): Number of simulation runs.
+        num_doors (int): Number of doors in the simulation.
+        seed (int, optional): Seed for the random number generator.
+
+    Returns:
+        tuple: The win rates (stay, switch).
+    """
+    stay_win_rate = monty_hall_simulation(num_trials, num_doors, False, seed)
+    # Monty leaves a single other door closed, so switching wins exactly the games staying loses.
+    return stay_win_rate, 1.0 - stay_win_rate
+
+def win_rate_interval(win_rate, num_trials, confidence=0.95):
+    """
+    Computes a confidence interval for a simulated win rate from a single run.
+
+    Args:
+        win_rate (float): The simulated win rate.
+        num_trials (int): The number of trials behind the win rate.
+        confidence (float): The confidence level of the interval (default: 0.95).
+
+    Returns:
+        tuple: The lower and upper bounds of the interval.
+    """
+    wins = round(win_rate * num_trials)
+    alpha = 1 - confidence
+    try:
+        # Imported here rather than at the top: scipy.stats alone adds about half a second to startup.
+        from scipy.stats import beta
+    except ImportError:  # SciPy is optional; fall back to the Wilson score interval.
+        beta = None
+    if beta is not None:
+        # Exact Clopper-Pearson interval.
+        low = beta.ppf(alpha / 2, wins, num_trials - wins + 1) if wins > 0 else 0.0
+        high = beta.ppf(1 - alpha / 2, wins + 1, num_trials - wins) if wins < num_trials else 1.0
+        return float(low), float(high)
+    from statistics import NormalDist  # Python 3.8+; only this SciPy-less fallback needs it
+    z = NormalDist().inv_cdf(1 - alpha / 2)
+    center = (win_rate + z * z / (2 * num_trials)) / (1 + z * z / num_trials)
+    margin = z / (1 + z * z / num_trials) * math.sqrt(
+        win_rate * (1 - win_rate) / num_trials + z * z / (4 * num_trials * num_trials))
+    return center - margin, center + margin
+
+def monty_hall_analytic(num_doors):
+    """
+    Computes the exact win rates for the extended Monty Hall problem.
+
+    Args:
+        num_doors (int): Number of doors in the simulation.
+
+    Returns:
+        tuple: The exact win rates (stay, switch).
+    """
+    return 1.0 / num_doors, (num_doors - 1) / num_doors
+
 def main():
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description="Monty Hall Simulation Script")
     parser.add_argument('-i', '--interactive', action='store_true',
                         help="Run in interactive mode with a console menu.")
+    parser.add_argument('--analytic', action='store_true',
+                        help="Plot the exact win rates instead of simulating.")
     args = parser.parse_args()
 
     # Determine the number of doors based on interactive mode or default
@@ -106,21 +287,32 @@ def main():
 
     num_trials = 10000  # Number of trials for the simulation
 
-    # Run the simulation for both strategies
-    switch_win_rate = monty_hall_simulation(num_trials, num_doors, True)
-    stay_win_rate = monty_hall_simulation(num_trials, num_doors, False)
+    if args.analytic:
+        # The win rates are known exactly, so there is nothing to simulate.
+        stay_win_rate, switch_win_rate = monty_hall_analytic(num_doors)
+        print(f"\nExact win rates with {num_doors} doors:")
+    else:
+        # Run the simulation once and score both strategies
+        stay_win_rate, switch_win_rate = monty_hall_rates(num_trials, num_doors)
+        print(f"\nSimulation with {num_doors} doors and {num_trials} trials:")
 
     # Print the results
-    print(f"\nSimulation with {num_doors} doors and {num_trials} trials:")
     print(f"Win rate when switching doors: {switch_win_rate:.4f}")
     print(f"Win rate when staying with the original choice: {stay_win_rate:.4f}")
+    if not args.analytic:
+        switch_low, switch_high = win_rate_interval(switch_win_rate, num_trials)
+        stay_low, stay_high = win_rate_interval(stay_win_rate, num_trials)
+        print(f"95% confidence interval when switching: [{switch_low:.4f}, {switch_high:.4f}]")
+        print(f"95% confidence interval when staying: [{stay_low:.4f}, {stay_high:.4f}]")
 
     # Generate the bar chart
     labels = ['Switch Doors', 'Stay with Original Choice']
     win_rates = [switch_win_rate, stay_win_rate]
+    import matplotlib.pyplot as plt  # Imported here so the simulation itself never loads matplotlib
     plt.bar(labels, win_rates, color=['blue', 'red'])
     plt.ylabel('Win Rate')
-    plt.title(f'Monty Hall Simulation Results\n(Chatgpt o3 mini high)  ({num_doors} doors)')
+    results = 'Exact Win Rates' if args.analytic else 'Simulation Results'
+    plt.title(f'Monty Hall {results}\n(Chatgpt o3 mini high)  ({num_doors} doors)')
     plt.ylim(0, 1)
     plt.show()
 
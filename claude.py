@@ -1,78 +1,278 @@
 import random
-import matplotlib.pyplot as plt
 import argparse
+import functools
+import math
 import os
+import multiprocessing
 
-def monty_hall_simulation(num_trials, switch_doors, num_doors=3):
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure-Python loop.
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to the NumPy or pure-Python path.
+    njit = None
+
+try:
+    from _monty import monty_hall_count
+except ImportError:  # The C extension is optional; build it with `python setup.py build_ext --inplace`.
+    monty_hall_count = None
+
+try:
+    from joblib import Memory
+except ImportError:  # joblib is optional; seeded rates are then only cached in memory.
+    Memory = None
+
+try:
+    import cupy as cp
+except ImportError:  # CuPy is optional; large runs stay on the CPU paths.
+    cp = None
+
+# Shared PCG64 generator for unseeded runs, so each call skips gathering fresh OS entropy.
+_RNG = np.random.default_rng(np.random.SeedSequence()) if np is not None else None
+
+if njit is not None:
+    def _build_kernel(fixed_doors=0):
+        """Compiles the trial loop, folding in fixed_doors as a constant door count when it is non-zero."""
+        @njit(cache=True)
+        def kernel(num_trials, num_doors, switch_doors, seed):
+            """Counts the wins over num_trials games in compiled code, reseeding Numba's RNG from seed first."""
+            doors = fixed_doors if fixed_doors else num_doors
+            np.random.seed(seed)
+            wins = 0
+            for _ in range(num_trials):
+                car_door = np.random.randint(0, doors)
+                player_choice = np.random.randint(0, doors)
+                # XOR turns a stay win into a switch loss (and vice versa) without branching.
+                wins += np.int64(player_choice == car_door) ^ np.int64(switch_doors)
+            return wins
+        return kernel
+
+    _monty_kernel = _build_kernel()
+    # The menu only offers these door counts, so each gets a constant-folded kernel. They run only
+    # when _monty is not built: the C extension is checked first, and it is faster at every count.
+    _MONTY_KERNELS = {num_doors: _build_kernel(num_doors) for num_doors in (3, 10, 1000)}
+else:
+    _monty_kernel = None
+    _MONTY_KERNELS = {}
+
+PARALLEL_MIN_TRIALS = 1_000_000  # Below this, starting worker processes costs more than it saves.
+GPU_MIN_TRIALS = 1_000_000  # Below this, kernel launches and transfers cost more than the GPU saves.
+NUMPY_BLOCK_TRIALS = 1 << 18  # The NumPy path plays this many games per block, so its arrays stay in cache.
+
+def _count_wins(num_trials, switch_doors, num_doors, seed):
+    """Plays num_trials games in this process and returns the number of wins."""
+    if cp is not None and num_trials >= GPU_MIN_TRIALS:
+        # Every game is independent, so the GPU plays them all at once.
+        gpu_rng = cp.random.default_rng(seed)
+        car_doors = gpu_rng.integers(0, num_doors, size=num_trials, dtype=cp.int32)
+        player_choices = gpu_rng.integers(0, num_doors, size=num_trials, dtype=cp.int32)
+        stay_wins = int(cp.count_nonzero(car_doors == player_choices))
+        return num_trials - stay_wins if switch_doors else stay_wins
+
+    if monty_hall_count is not None:
+        return monty_hall_count(num_trials, num_doors, switch_doors, seed)
+
+    if _monty_kernel is not None:
+        # Numba keeps one RNG per process, so an unseeded run still reseeds it, from OS
+        # entropy, rather than continuing from whatever a seeded run left behind.
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little")
+        return _MONTY_KERNELS.get(num_doors, _monty_kernel)(num_trials, num_doors, switch_doors, seed)
+
+    if np is not None:
+        # Monty leaves only one other door closed, so switching wins exactly
+        # when the first pick was wrong.
+        rng = _RNG if seed is None else np.random.default_rng(seed)
+        # Keep each door in its own int32 column and play the games in blocks,
+        # comparing the columns into one reused buffer.
+        matches = np.empty(min(num_trials, NUMPY_BLOCK_TRIALS), dtype=bool)
+        stay_wins = 0
+        for start in range(0, num_trials, NUMPY_BLOCK_TRIALS):
+            size = min(NUMPY_BLOCK_TRIALS, num_trials - start)
+            car_doors, player_choices = rng.integers(0, num_doors, size=(2, size), dtype=np.int32)
+            stay_wins += np.count_nonzero(np.equal(car_doors, player_choices, out=matches[:size]))
+        return num_trials - stay_wins if switch_doors else stay_wins
+
+    # A private generator, so seeding never touches the caller's random module state.
+    loop_rng = random.Random(seed)
+
+    wins = 0
+    for _ in range(num_trials):
+        # Randomly assign the car to one of the doors
+        car_door = loop_rng.randint(0, num_doors - 1)
+        # Player makes a random initial choice
+        player_choice = loop_rng.randint(0, num_doors - 1)
+
+        # Monty leaves one other door closed: the car if the player missed it,
+        # otherwise a goat. Switching therefore wins exactly when staying loses.
+        wins += (player_choice == car_door) ^ switch_doors
+
+    return wins
+
+def _count_wins_worker(chunk):
+    """Unpacks one chunk of trials for multiprocessing.Pool.map."""
+    return _count_wins(*chunk)
+
+def monty_hall_simulation(num_trials, switch_doors, num_doors=3, seed=None):
     """
     Simulates the Monty Hall problem for a specified number of trials and doors.
     Args:
         num_trials (int): The number of times to run the simulation.
         switch_doors (bool): Whether the player switches doors after Monty's reveal.
         num_doors (int): The number of doors in the game (default: 3)
+        seed (int, optional): Seed for the random number generator
     Returns:
         float: The win rate (number of wins / total trials).
     """
-    wins = 0
-    for _ in range(num_trials):
-        # Randomly assign the car to one of the doors
-        car_door = random.randint(0, num_doors - 1)
-        # Player makes a random initial choice
-        player_choice = random.randint(0, num_doors - 1)
-        
-        # Monty reveals all but one door (excluding car and player's choice)
-        available_doors = set(range(num_doors))
-        available_doors.remove(car_door)  # Remove car door
-        if player_choice in available_doors:
-            available_doors.remove(player_choice)  # Remove player's choice if it's not the car door
-            
-        # Monty reveals all doors except one (if switching) or none (if staying)
-        if switch_doors:
-            # Leave one door unopened (besides player's choice)
-            remaining_door = None
-            if player_choice == car_door:
-                # If player chose car, randomly keep one goat door closed
-                remaining_door = random.choice(list(available_doors))
-            else:
-                # If player chose goat, keep car door closed
-                remaining_door = car_door
-                
-            # Switch to the remaining unopened door
-            player_choice = remaining_door
-
-        # Check if won
-        if player_choice == car_door:
-            wins += 1
-            
+    processes = os.cpu_count() or 1
+    # Runs big enough for the GPU path stay in one process, which keeps the GPU busy on its own.
+    if num_trials < PARALLEL_MIN_TRIALS or processes == 1 or cp is not None:
+        return _count_wins(num_trials, switch_doors, num_doors, seed) / num_trials
+
+    # Split the trials across processes, giving each chunk its own seed so the
+    # workers do not replay the same games.
+    seeder = random.Random(seed)
+    chunks = []
+    for chunk in range(processes):
+        chunk_trials = num_trials // processes + (chunk < num_trials % processes)
+        chunks.append((chunk_trials, switch_doors, num_doors, seeder.randrange(2 ** 32)))
+    with multiprocessing.Pool(processes) as pool:
+        wins = sum(pool.map(_count_wins_worker, chunks))
     return wins / num_trials
 
-def run_simulation(num_doors, save_path=None):
+def monty_hall_rates(num_trials, num_doors=3, seed=None):
+    """
+    Simulates the game once and scores both strategies on the same games.
+    Args:
+        num_trials (int): The number of times to run the simulation.
+        num_doors (int): The number of doors in the game (default: 3)
+        seed (int, optional): Seed for the random number generator
+    Returns:
+        tuple: The win rates for staying and for switching.
+    """
+    stay_win_rate = monty_hall_simulation(num_trials, False, num_doors, seed)
+    # Monty leaves a single other door closed, so switching wins exactly the games staying loses.
+    return stay_win_rate, 1.0 - stay_win_rate
+
+# Seeded runs draw different, equally valid games on each backend, so cached rates are kept
+# per backend; bump _CACHE_VERSION whenever a fix changes what a seeded run returns.
+_CACHE_VERSION = 2
+_BACKEND = ("cupy" if cp is not None else "_monty" if monty_hall_count is not None
+            else "numba" if _monty_kernel is not None else "numpy" if np is not None else "python")
+
+def _disk_rates(num_doors, num_trials, seed):
+    """Runs monty_hall_rates for a seeded run; wrapped in an on-disk cache when joblib is installed."""
+    return monty_hall_rates(num_trials, num_doors, seed)
+
+if Memory is not None:
+    # Keep seeded rates across sessions, so later runs skip the expensive 1000-door simulation.
+    _disk_rates = Memory(os.path.expanduser(f"~/.cache/montyhall/claude/{_BACKEND}-v{_CACHE_VERSION}"), verbose=0).cache(_disk_rates)
+
+@functools.lru_cache(maxsize=16)
+def _cached_rates(num_doors, num_trials, seed):
+    """Memoizes seeded win rates in memory, in front of the on-disk cache."""
+    return _disk_rates(num_doors, num_trials, seed)
+
+def win_rate_interval(win_rate, num_trials, confidence=0.95):
+    """
+    Computes a confidence interval for a simulated win rate from a single run.
+    Args:
+        win_rate (float): The simulated win rate.
+        num_trials (int): The number of trials behind the win rate.
+        confidence (float): The confidence level of the interval (default: 0.95).
+    Returns:
+        tuple: The lower and upper bounds of the interval.
+    """
+    wins = round(win_rate * num_trials)
+    alpha = 1 - confidence
+    try:
+        # Imported here rather than at the top: scipy.stats alone adds about half a second to startup.
+        from scipy.stats import beta
+    except ImportError:  # SciPy is optional; fall back to the Wilson score interval.
+        beta = None
+    if beta is not None:
+        # Exact Clopper-Pearson interval.
+        low = beta.ppf(alpha / 2, wins, num_trials - wins + 1) if wins > 0 else 0.0
+        high = beta.ppf(1 - alpha / 2, wins + 1, num_trials - wins) if wins < num_trials else 1.0
+        return float(low), float(high)
+    from statistics import NormalDist  # Python 3.8+; only this SciPy-less fallback needs it
+    z = NormalDist().inv_cdf(1 - alpha / 2)
+    center = (win_rate + z * z / (2 * num_trials)) / (1 + z * z / num_trials)
+    margin = z / (1 + z * z / num_trials) * math.sqrt(
+        win_rate * (1 - win_rate) / num_trials + z * z / (4 * num_trials * num_trials))
+    return center - margin, center + margin
+
+def monty_hall_analytic(num_doors):
+    """
+    Computes the exact win rates when Monty opens all but one other door.
+    Args:
+        num_doors (int): The number of doors in the game
+    Returns:
+        tuple: The exact win rates for staying and for switching.
+    """
+    return 1.0 / num_doors, (num_doors - 1) / num_doors
+
+_SAVE_AX = None  # Off-screen axes shared by every saved graph, created on first use.
+
+def _save_axes():
+    """Returns the off-screen axes that saved graphs are drawn on, reused across runs."""
+    global _SAVE_AX
+    if _SAVE_AX is None:
+        # Import here so simulation-only use never loads matplotlib.
+        from matplotlib.figure import Figure
+        _SAVE_AX = Figure(figsize=(8, 6)).subplots()
+    return _SAVE_AX
+
+def run_simulation(num_doors, save_path=None, exact=False, ax=None, seed=0):
     """
     Runs the simulation for a specific number of doors and displays results.
     """
     num_trials = 10000
-    switch_win_rate = monty_hall_simulation(num_trials, True, num_doors)
-    stay_win_rate = monty_hall_simulation(num_trials, False, num_doors)
+    if exact:
+        stay_win_rate, switch_win_rate = monty_hall_analytic(num_doors)
+    elif seed is None:
+        stay_win_rate, switch_win_rate = monty_hall_rates(num_trials, num_doors)
+    else:
+        # A seeded run always gives the same rates, so repeats come from the cache.
+        stay_win_rate, switch_win_rate = _cached_rates(num_doors, num_trials, seed)
     
     print(f"\nResults for {num_doors} doors:")
     print(f"Win rate when switching doors: {switch_win_rate:.4f}")
     print(f"Win rate when staying with the original choice: {stay_win_rate:.4f}")
+    if not exact:
+        switch_low, switch_high = win_rate_interval(switch_win_rate, num_trials)
+        stay_low, stay_high = win_rate_interval(stay_win_rate, num_trials)
+        print(f"95% confidence interval when switching: [{switch_low:.4f}, {switch_high:.4f}]")
+        print(f"95% confidence interval when staying: [{stay_low:.4f}, {stay_high:.4f}]")
     
     # Visualize results
     labels = ['Switch Doors', 'Stay with Original Choice']
     win_rates = [switch_win_rate, stay_win_rate]
-    plt.figure(figsize=(8, 6))
-    plt.bar(labels, win_rates, color=['blue', 'red'])
-    plt.ylabel('Win Rate')
-    plt.title(f'Monty Hall Simulation Results\n(Claude 3.5 Sonnet)  ({num_doors} doors)')
-    plt.ylim(0, 1)
-    
-    if save_path:
-        plt.savefig(save_path)
-    plt.show()
-    plt.close()
+    interactive = ax is None
+    if interactive:
+        # pyplot is only needed for a window; saved graphs use the off-screen Figure.
+        import matplotlib.pyplot as plt
+        ax = plt.figure(figsize=(8, 6)).gca()
+    else:
+        ax.clear()
+    try:
+        ax.bar(labels, win_rates, color=['blue', 'red'])
+        ax.set_ylabel('Win Rate')
+        ax.set_title(f'Monty Hall Simulation Results\n(Claude 3.5 Sonnet)  ({num_doors} doors)')
+        ax.set_ylim(0, 1)
+        if save_path:
+            ax.figure.savefig(save_path)
+        if interactive:
+            plt.show()
+    finally:
+        if interactive:
+            # Release the window's figure even if saving fails, so pyplot does not keep it alive.
+            plt.close(ax.figure)
 
-def run_all_simulations():
+def run_all_simulations(exact=False, seed=0):
     """Runs simulations for all door configurations and saves the graphs."""
     images_dir = '/Users/wleon/Dropbox/_Back2Bits/TheMontyHallProblem/images'
     os.makedirs(images_dir, exist_ok=True)
@@ -83,11 +283,14 @@ def run_all_simulations():
         (1000, 'claude_1000_doors.jpg')
     ]
     
+    # The graphs are only saved, so draw them all on one off-screen (Agg) figure
+    # instead of opening a GUI window per configuration.
+    ax = _save_axes()
     for num_doors, filename in configurations:
         save_path = os.path.join(images_dir, filename)
-        run_simulation(num_doors, save_path)
+        run_simulation(num_doors, save_path, exact=exact, ax=ax, seed=seed)
 
-def interactive_menu():
+def interactive_menu(exact=False, seed=0):
     """
     Displays an interactive menu for the user to choose simulation options.
     """
@@ -102,13 +305,13 @@ def interactive_menu():
         choice = input("\nEnter your choice (1-5): ")
         
         if choice == '1':
-            run_simulation(3)
+            run_simulation(3, exact=exact, seed=seed)
         elif choice == '2':
-            run_simulation(10)
+            run_simulation(10, exact=exact, seed=seed)
         elif choice == '3':
-            run_simulation(1000)
+            run_simulation(1000, exact=exact, seed=seed)
         elif choice == '4':
-            run_all_simulations()
+            run_all_simulations(exact=exact, seed=seed)
         elif choice == '5':
             print("Goodbye!")
             break
@@ -119,13 +322,17 @@ def main():
     parser = argparse.ArgumentParser(description='Monty Hall Problem Simulator')
     parser.add_argument('-i', '--interactive', action='store_true',
                         help='Run in interactive mode with menu')
+    parser.add_argument('--analytic', action='store_true',
+                        help='Plot the exact win rates instead of simulating')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed for the simulation (default: 0)')
     args = parser.parse_args()
     
     if args.interactive:
-        interactive_menu()
+        interactive_menu(exact=args.analytic, seed=args.seed)
     else:
         # Default behavior: run with 3 doors
-        run_simulation(3)
+        run_simulation(3, exact=args.analytic, seed=args.seed)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -19,59 +19,242 @@ Dependencies:
 - Python 3.6 or higher
 - `random` package (built-in)
 - `matplotlib` package (install with `pip install matplotlib`)
+- `numpy` package (optional, install with `pip install numpy`)
+- `numba` package (optional, install with `pip install numba`)
+- `cupy` package (optional, for large runs on an NVIDIA GPU; see https://cupy.dev)
 """
 
 import random
-import matplotlib.pyplot as plt
 import argparse
+import functools
 import os
+import multiprocessing
 
-def monty_hall_simulation(num_trials, switch_doors, num_doors):
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure-Python loop.
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to the NumPy or pure-Python path.
+    njit = None
+
+try:
+    import cupy as cp
+except ImportError:  # CuPy is optional; large runs stay on the CPU paths.
+    cp = None
+
+# One generator for every unseeded NumPy run, so each call skips reseeding from OS entropy.
+_RNG = np.random.default_rng(np.random.SeedSequence()) if np is not None else None
+GPU_MIN_TRIALS = 1_000_000  # Below this, kernel launches and transfers cost more than the GPU saves.
+PARALLEL_MIN_TRIALS = 200_000  # Below this, starting worker processes costs more than the Python loop.
+KERNEL_CHUNKS = 64  # Fixed chunks, each seeded on its own, keep seeded kernel runs repeatable across core counts.
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _monty_kernel(num_trials, num_doors, seed):
+        """Counts the (stay, switch) wins over num_trials games in compiled code, spread across all cores.
+
+        Each of the KERNEL_CHUNKS chunks reseeds its thread's generator from seed, so the
+        counts depend only on seed, not on how many threads ran them.
+        """
+        stay_wins = 0
+        switch_wins = 0
+        for chunk in prange(KERNEL_CHUNKS):
+            np.random.seed((seed * KERNEL_CHUNKS + chunk) & 0xFFFFFFFF)
+            chunk_stay = 0
+            chunk_switch = 0
+            for _ in range(num_trials // KERNEL_CHUNKS + (chunk < num_trials % KERNEL_CHUNKS)):
+                car_door = np.random.randint(0, num_doors)
+                player_choice = np.random.randint(0, num_doors)
+                stayed = np.int64(player_choice == car_door)
+                chunk_stay += stayed
+                # A wrong first pick leaves the car among the num_doors - 2 doors to switch to.
+                chunk_switch += (stayed ^ 1) & np.int64(np.random.random() * (num_doors - 2) < 1.0)
+            stay_wins += chunk_stay
+            switch_wins += chunk_switch
+        return stay_wins, switch_wins
+else:
+    _monty_kernel = None
+
+def _door_pairs(rng, num_doors, num_trials):
     """
-    Simulates the Monty Hall problem for a specified number of trials and doors.
+    Draws the car door and first pick of num_trials games in the narrowest integer type that fits.
+
+    One byte per door up to 127 doors (two up to 32767) keeps the arrays, and the
+    memory traffic of comparing them, a fraction of the int64 default.
+    """
+    if num_doors <= 127:
+        dtype = np.int8
+    elif num_doors <= 32767:
+        dtype = np.int16
+    else:
+        dtype = np.int32
+    car_doors, player_choices = rng.integers(0, num_doors, size=(2, num_trials), dtype=dtype)
+    return car_doors, player_choices
+
+def random_door_except(num_doors, *excluded_doors, randrange=random.randrange):
+    """
+    Picks a door uniformly at random from the doors that are not excluded.
 
     Args:
-        num_trials (int): The number of times to run the simulation.
-        switch_doors (bool): Whether the player switches doors after Monty's reveal.
         num_doors (int): The number of doors in the simulation.
+        *excluded_doors (int): The doors that cannot be picked.
+        randrange (callable, optional): The randrange to draw with (default: random.randrange).
 
     Returns:
-        float: The win rate (number of wins / total trials).
+        int: The picked door.
     """
-    wins = 0  # Initialize the win counter
+    excluded_doors = sorted(set(excluded_doors))
+    door = randrange(num_doors - len(excluded_doors))  # Draw among the allowed doors only
+    for excluded_door in excluded_doors:  # Shift the draw past each excluded door, lowest first
+        if door >= excluded_door:
+            door += 1
+    return door
+
+def _loop_wins(num_trials, num_doors, seed):
+    """
+    Plays num_trials games in plain Python and returns the (stay, switch) win counts.
+    """
+    # Bind randrange from a private generator: the loop skips the attribute lookup, and
+    # seeding it leaves the global random module alone.
+    randrange = random.Random(seed).randrange
+
+    stay_wins = 0  # Initialize the win counters
+    switch_wins = 0
     for _ in range(num_trials):  # Iterate through each trial
         # Randomly assign the car to one of the doors
-        car_door = random.randint(0, num_doors - 1)
+        car_door = randrange(num_doors)
 
         # Player makes a random initial choice of doors
-        player_choice = random.randint(0, num_doors - 1)
+        player_choice = randrange(num_doors)
 
         # Monty reveals a goat behind a door that is NOT the car and NOT the player's choice.
-        monty_reveal = random.choice([i for i in range(num_doors) if i != car_door and i != player_choice])
+        monty_reveal = random_door_except(num_doors, car_door, player_choice, randrange=randrange)
 
-        # If the player switches doors:
-        if switch_doors:
-            # Determine the door to switch to.
-            # It must be different from the player's original choice and Monty's reveal.
-            player_choice = [i for i in range(num_doors) if i != player_choice and i != monty_reveal][0]
+        # Determine the door to switch to.
+        # It must be different from the player's original choice and Monty's reveal.
+        switch_choice = random_door_except(num_doors, player_choice, monty_reveal, randrange=randrange)
 
-        # Check if the player's final choice (after potentially switching) is the car door.
+        # Score both strategies on the same game.
         if player_choice == car_door:
-            wins += 1  # Increment the win counter if the player won.
+            stay_wins += 1
+        if switch_choice == car_door:
+            switch_wins += 1
+
+    return stay_wins, switch_wins
+
+def monty_hall_rates(num_trials, num_doors, seed=None):
+    """
+    Simulates the Monty Hall problem once and scores both strategies on the same games.
+
+    Args:
+        num_trials (int): The number of times to run the simulation.
+        num_doors (int): The number of doors in the simulation.
+        seed (int, optional): Seed for the random number generator.
+
+    Returns:
+        tuple: The win rates for staying and for switching.
+    """
+    if cp is not None and num_trials >= GPU_MIN_TRIALS:
+        # Play the games on the GPU, scoring both strategies there; only the two counts come back.
+        gpu_rng = cp.random.default_rng(seed)
+        car_doors = gpu_rng.integers(0, num_doors, size=num_trials, dtype=cp.int32)
+        player_choices = gpu_rng.integers(0, num_doors, size=num_trials, dtype=cp.int32)
+        stayed = player_choices == car_doors
+        lucky_switch = gpu_rng.random(num_trials) < 1 / (num_doors - 2)
+        return int(cp.count_nonzero(stayed)) / num_trials, int(cp.count_nonzero(~stayed & lucky_switch)) / num_trials
+
+    if _monty_kernel is not None:
+        # The kernel reseeds itself on every call, so unseeded runs hand it fresh OS entropy.
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little")
+        stay_wins, switch_wins = _monty_kernel(num_trials, num_doors, seed)
+        return stay_wins / num_trials, switch_wins / num_trials
+
+    if np is not None:
+        # Draw every trial at once instead of looping in Python.
+        rng = _RNG if seed is None else np.random.default_rng(seed)
+        car_doors, player_choices = _door_pairs(rng, num_doors, num_trials)
+        stayed = player_choices == car_doors
+        # After Monty's reveal, num_doors - 2 doors are left to switch to; the switch
+        # can only find the car if the first pick was wrong, and then 1 time in num_doors - 2.
+        lucky_switch = rng.random(num_trials) < 1 / (num_doors - 2)
+        return np.count_nonzero(stayed) / num_trials, np.count_nonzero(~stayed & lucky_switch) / num_trials
 
-    return wins / num_trials  # Calculate and return the win rate.
+    processes = os.cpu_count() or 1
+    if num_trials < PARALLEL_MIN_TRIALS or processes == 1:
+        stay_wins, switch_wins = _loop_wins(num_trials, num_doors, seed)
+    else:
+        # Split the trials across processes. Each chunk gets its own seed, drawn from the
+        # run's seed, so the workers never replay the same games.
+        seeder = random.Random(seed)
+        chunks = [(num_trials // processes + (chunk < num_trials % processes), num_doors, seeder.randrange(2 ** 32))
+                  for chunk in range(processes)]
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.starmap(_loop_wins, chunks)
+        stay_wins = sum(stay for stay, _ in results)
+        switch_wins = sum(switch for _, switch in results)
+
+    return stay_wins / num_trials, switch_wins / num_trials  # Calculate and return the win rates.
+
+@functools.lru_cache(maxsize=32)
+def _cached_rates(num_doors, num_trials, seed):
+    """
+    Returns the win rates of a seeded run, simulating it only the first time it is asked for.
+    """
+    return monty_hall_rates(num_trials, num_doors, seed)
+
+def monty_hall_simulation(num_trials, switch_doors, num_doors):
+    """
+    Simulates the Monty Hall problem for a specified number of trials and doors.
+
+    Args:
+        num_trials (int): The number of times to run the simulation.
+        switch_doors (bool): Whether the player switches doors after Monty's reveal.
+        num_doors (int): The number of doors in the simulation.
+
+    Returns:
+        float: The win rate (number of wins / total trials).
+    """
+    stay_win_rate, switch_win_rate = monty_hall_rates(num_trials, num_doors)
+    return switch_win_rate if switch_doors else stay_win_rate
+
+def monty_hall_analytic(num_doors):
+    """
+    Computes the exact win rates when Monty opens a single goat door.
+
+    The first pick wins 1 time in num_doors. Otherwise the car is behind one of the
+    num_doors - 2 doors left to switch to, so switching wins
+    (num_doors - 1) / (num_doors * (num_doors - 2)) of the games.
+
+    Args:
+        num_doors (int): The number of doors in the simulation.
 
-def run_simulation(num_doors, save_path=None):
+    Returns:
+        tuple: The exact win rates for staying and for switching.
+    """
+    return 1.0 / num_doors, (num_doors - 1) / (num_doors * (num_doors - 2))
+
+def run_simulation(num_doors, save_path=None, exact=False, seed=0, ax=None):
     """
     Runs the Monty Hall simulation for a specified number of doors and displays the results.
 
     Args:
         num_doors (int): The number of doors in the simulation.
         save_path (str, optional): Path to save the graph image.
+        exact (bool): Plot the exact win rates instead of simulating.
+        seed (int, optional): Seed for the simulation; None runs a fresh, uncached simulation.
+        ax (matplotlib.axes.Axes, optional): Axes to draw on instead of opening a window.
     """
     num_trials = 10000
-    switch_win_rate = monty_hall_simulation(num_trials, True, num_doors)
-    stay_win_rate = monty_hall_simulation(num_trials, False, num_doors)
+    if exact:
+        stay_win_rate, switch_win_rate = monty_hall_analytic(num_doors)
+    elif seed is None:
+        stay_win_rate, switch_win_rate = monty_hall_rates(num_trials, num_doors)  # Simulate both strategies at once
+    else:
+        stay_win_rate, switch_win_rate = _cached_rates(num_doors, num_trials, seed)  # Seeded runs repeat, so reuse them
 
     print(f"Win rate when switching doors: {switch_win_rate:.4f}")
     print(f"Win rate when staying with the original choice: {stay_win_rate:.4f}")
@@ -79,36 +262,51 @@ def run_simulation(num_doors, save_path=None):
     labels = ['Switch Doors', 'Stay with Original Choice']
     win_rates = [switch_win_rate, stay_win_rate]
 
-    plt.figure()
-    plt.bar(labels, win_rates, color=['blue', 'red'])
-    plt.ylabel('Win Rate')
-    plt.title(f'Monty Hall Simulation Results\n(Deepseek) ({num_doors} doors)')
-    plt.ylim(0, 1)
+    interactive = ax is None
+    if interactive:
+        import matplotlib.pyplot as plt  # Imported here so the simulation itself never loads matplotlib
+        ax = plt.figure().gca()
+    else:
+        ax.clear()
+    ax.bar(labels, win_rates, color=['blue', 'red'])
+    ax.set_ylabel('Win Rate')
+    ax.set_title(f'Monty Hall Simulation Results\n(Deepseek) ({num_doors} doors)')
+    ax.set_ylim(0, 1)
     
     if save_path:
-        plt.savefig(save_path)
-    plt.show()
-    plt.close()
+        ax.figure.savefig(save_path)
+    if interactive:
+        plt.show()
+        plt.close()
 
-def run_all_simulations():
+def run_all_simulations(exact=False, seed=0):
     """Runs all simulations and saves the graphs."""
     images_dir = '/Users/wleon/Dropbox/_Back2Bits/TheMontyHallProblem/images'
     os.makedirs(images_dir, exist_ok=True)
     
+    from matplotlib.figure import Figure
+
     configurations = [
         (3, 'deepseek_3_doors.jpg'),
         (10, 'deepseek_10_doors.jpg'),
         (1000, 'deepseek_1000_doors.jpg')
     ]
     
+    ax = Figure().subplots()  # One off-screen figure, cleared and saved for each configuration
     for num_doors, filename in configurations:
         save_path = os.path.join(images_dir, filename)
-        run_simulation(num_doors, save_path)
+        run_simulation(num_doors, save_path, exact=exact, seed=seed, ax=ax)
 
-def interactive_menu():
+def interactive_menu(exact=False, seed=0):
     """
     Displays an interactive console menu for running the Monty Hall simulation.
     """
+    menu_actions = {  # Map each menu choice to the run it starts
+        '1': lambda: run_simulation(3, exact=exact, seed=seed),
+        '2': lambda: run_simulation(10, exact=exact, seed=seed),
+        '3': lambda: run_simulation(1000, exact=exact, seed=seed),
+        '4': lambda: run_all_simulations(exact=exact, seed=seed),
+    }
     while True:
         print("\nMonty Hall Simulation Menu")
         print("1. Run the problem with 3 doors")
@@ -118,27 +316,24 @@ def interactive_menu():
         print("5. Exit")
         choice = input("Enter your choice (1-5): ")
 
-        if choice == '1':
-            run_simulation(3)
-        elif choice == '2':
-            run_simulation(10)
-        elif choice == '3':
-            run_simulation(1000)
-        elif choice == '4':
-            run_all_simulations()
-        elif choice == '5':
+        if choice == '5':
             print("Exiting the program.")
             break
-        else:
+        action = menu_actions.get(choice)
+        if action is None:
             print("Invalid choice. Please enter a number between 1 and 5.")
+        else:
+            action()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Monty Hall Simulation Script")
     parser.add_argument('-i', '--interactive', action='store_true', help="Run the script in interactive mode")
+    parser.add_argument('--analytic', action='store_true', help="Plot the exact win rates instead of simulating")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for the simulation (default: 0)")
     args = parser.parse_args()
 
     if args.interactive:
-        interactive_menu()
+        interactive_menu(exact=args.analytic, seed=args.seed)
     else:
         # Default behavior: run the simulation with 3 doors
-        run_simulation(3)
\ No newline at end of file
+        run_simulation(3, exact=args.analytic, seed=args.seed)
\ No newline at end of file
@@ -1,9 +1,95 @@
 import random
-import matplotlib.pyplot as plt
 import argparse
+import multiprocessing
+import os
+import functools
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure-Python loop.
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to the NumPy or pure-Python path.
+    njit = None
+
+try:
+    import cupy as cp
+except ImportError:  # CuPy is optional; large runs stay on the CPU paths.
+    cp = None
+
+# Shared generator for unseeded runs; a fresh default_rng() per call would reseed from the OS each time.
+_RNG = np.random.default_rng(np.random.SeedSequence()) if np is not None else None
+GPU_MIN_TRIALS = 1_000_000  # Below this, kernel launches and transfers cost more than the GPU saves.
+PARALLEL_MIN_TRIALS = 200_000  # Below this, starting worker processes costs more than the Python loop.
+KERNEL_CHUNKS = 64  # Fixed chunks, each seeded on its own, keep seeded kernel runs repeatable across core counts.
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _monty_kernel(num_trials, num_doors, switch_doors, seed):
+        """Counts the wins over num_trials games in compiled code, spread across all cores.
+
+        Each of the KERNEL_CHUNKS chunks reseeds its thread's generator from seed, so the
+        count depends only on seed, not on how many threads ran it.
+        """
+        wins = 0
+        for chunk in prange(KERNEL_CHUNKS):
+            np.random.seed((seed * KERNEL_CHUNKS + chunk) & 0xFFFFFFFF)
+            chunk_wins = 0
+            for _ in range(num_trials // KERNEL_CHUNKS + (chunk < num_trials % KERNEL_CHUNKS)):
+                car_door = np.random.randint(0, num_doors)
+                player_choice = np.random.randint(0, num_doors)
+                # XOR turns a stay win into a switch loss (and vice versa) without branching.
+                chunk_wins += np.int64(player_choice == car_door) ^ np.int64(switch_doors)
+            wins += chunk_wins
+        return wins
+else:
+    _monty_kernel = None
+
+
+def _door_pairs(rng, num_doors, num_trials):
+    """
+    Returns the car doors and first picks for num_trials games as int8/int16/int32 arrays,
+    whichever is the smallest type that holds num_doors.
+    """
+    if num_doors <= 127:
+        dtype = np.int8
+    elif num_doors <= 32767:
+        dtype = np.int16
+    else:
+        dtype = np.int32
+    car_doors, player_choices = rng.integers(0, num_doors, size=(2, num_trials), dtype=dtype)
+    return car_doors, player_choices
+
+
+def _loop_wins(num_trials, switch_doors, num_doors, seed):
+    """Plays num_trials games in plain Python and returns the number of wins."""
+    # A local generator keeps seeded runs from resetting the shared random module.
+    randrange = random.Random(seed).randrange
+
+    wins = 0
+    for _ in range(num_trials):
+        car_door = randrange(num_doors)
+        player_choice = randrange(num_doors)
+
+        # Monty reveals goat doors until only two are closed: the player's choice and
+        # one other door, which is the car unless the player already picked it.
+        if switch_doors:
+            if car_door != player_choice:
+                player_choice = car_door
+            else:
+                # Any goat can stay closed; draw one of the other doors without listing them.
+                other_door = randrange(num_doors - 1)
+                player_choice = other_door + (other_door >= player_choice)
 
+        if player_choice == car_door:
+            wins += 1
+
+    return wins
 
-def monty_hall_simulation(num_trials, switch_doors, num_doors=3):
+
+def monty_hall_simulation(num_trials, switch_doors, num_doors=3, seed=None):
     """
     Simulates the Monty Hall problem for a specified number of trials and doors.
 
@@ -11,39 +97,96 @@ def monty_hall_simulation(num_trials, switch_doors, num_doors=3):
         num_trials (int): The number of times to run the simulation.
         switch_doors (bool): Whether the player switches doors after Monty's reveal.
         num_doors (int): The total number of doors in the game.
+        seed (int, optional): Seed for the random number generator.
 
     Returns:
         float: The win rate (number of wins / total trials).
     """
-    wins = 0
-    for _ in range(num_trials):
-        car_door = random.randint(0, num_doors - 1)
-        player_choice = random.randint(0, num_doors - 1)
+    if cp is not None and num_trials >= GPU_MIN_TRIALS:
+        # Every game is independent, so the GPU plays them all at once.
+        gpu_rng = cp.random.default_rng(seed)
+        car_doors = gpu_rng.integers(0, num_doors, size=num_trials, dtype=cp.int32)
+        player_choices = gpu_rng.integers(0, num_doors, size=num_trials, dtype=cp.int32)
+        if switch_doors:
+            return int(cp.count_nonzero(player_choices != car_doors)) / num_trials
+        return int(cp.count_nonzero(player_choices == car_doors)) / num_trials
+
+    if _monty_kernel is not None:
+        # Unseeded runs still need a seed for the kernel; draw one from the OS.
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little")
+        return _monty_kernel(num_trials, num_doors, switch_doors, seed) / num_trials
+
+    if np is not None:
+        # Draw every trial at once instead of looping in Python. Monty leaves only
+        # one other door closed, so switching wins exactly when the first pick was wrong.
+        rng = _RNG if seed is None else np.random.default_rng(seed)
+        car_doors, player_choices = _door_pairs(rng, num_doors, num_trials)
+        if switch_doors:
+            return np.count_nonzero(player_choices != car_doors) / num_trials
+        return np.count_nonzero(player_choices == car_doors) / num_trials
+
+    processes = os.cpu_count() or 1
+    if num_trials < PARALLEL_MIN_TRIALS or processes == 1:
+        return _loop_wins(num_trials, switch_doors, num_doors, seed) / num_trials
+
+    # Hand each process a share of the trials and its own seed, drawn from the run's
+    # seed, so no two workers replay the same games.
+    seeder = random.Random(seed)
+    chunks = [(num_trials // processes + (chunk < num_trials % processes), switch_doors, num_doors, seeder.randrange(2 ** 32))
+              for chunk in range(processes)]
+    with multiprocessing.Pool(processes) as pool:
+        wins = sum(pool.starmap(_loop_wins, chunks))
+    return wins / num_trials
 
-        # Monty reveals goat doors (all but two: player choice and car door)
-        possible_reveals = [i for i in range(num_doors) if i != car_door and i != player_choice]
 
-        # Randomly choose doors for Monty to reveal until only 2 are left.
-        while len(possible_reveals) > (num_doors - 2):
-            reveal_choice = random.choice(possible_reveals)
-            possible_reveals.remove(reveal_choice)
+def monty_hall_rates(num_trials, num_doors=3, seed=None):
+    """
+    Simulates the game once and scores both strategies on the same games.
 
-        monty_reveal = possible_reveals[0]  # could be more than one door
+    Args:
+        num_trials (int): The number of times to run the simulation.
+        num_doors (int): The total number of doors in the game.
+        seed (int, optional): Seed for the random number generator.
 
-        if switch_doors:
-            player_choice = [i for i in range(num_doors) if i != player_choice and i not in possible_reveals][0]
+    Returns:
+        tuple: The win rates for staying and for switching.
+    """
+    stay_win_rate = monty_hall_simulation(num_trials, False, num_doors, seed)
+    # Monty leaves a single other door closed, so switching wins exactly the games staying loses.
+    return stay_win_rate, 1.0 - stay_win_rate
 
-        if player_choice == car_door:
-            wins += 1
 
-    return wins / num_trials
+@functools.lru_cache(maxsize=32)
+def _cached_rates(num_doors, num_trials, seed):
+    """Remembers the rates of seeded runs, which always come out the same."""
+    return monty_hall_rates(num_trials, num_doors, seed)
 
 
-def run_simulation(num_doors, num_trials=10000):
-    """Runs the simulation and displays results."""
+def monty_hall_analytic(num_doors=3):
+    """
+    Computes the exact win rates for the game.
 
-    switch_win_rate = monty_hall_simulation(num_trials, True, num_doors)
-    stay_win_rate = monty_hall_simulation(num_trials, False, num_doors)
+    Args:
+        num_doors (int): The total number of doors in the game.
+
+    Returns:
+        tuple: The exact win rates for staying and for switching.
+    """
+    # The first pick holds the car 1 time in num_doors; every other time the one door
+    # Monty leaves closed does.
+    return 1.0 / num_doors, (num_doors - 1) / num_doors
+
+
+def run_simulation(num_doors, num_trials=10000, exact=False, seed=0):
+    """Runs the simulation and displays results (seed=None draws a fresh, uncached run)."""
+
+    if exact:
+        stay_win_rate, switch_win_rate = monty_hall_analytic(num_doors)
+    elif seed is None:
+        stay_win_rate, switch_win_rate = monty_hall_rates(num_trials, num_doors)
+    else:
+        stay_win_rate, switch_win_rate = _cached_rates(num_doors, num_trials, seed)
 
     print(f"Number of doors: {num_doors}")
     print(f"Win rate when switching doors: {switch_win_rate:.4f}")
@@ -52,14 +195,17 @@ def run_simulation(num_doors, num_trials=10000):
     labels = ['Switch Doors', 'Stay with Original Choice']
     win_rates = [switch_win_rate, stay_win_rate]
 
+    import matplotlib.pyplot as plt  # Imported here so the simulation itself never loads matplotlib
     plt.bar(labels, win_rates, color=['blue', 'red'])
     plt.ylabel('Win Rate')
     plt.title(f'Monty Hall Simulation Results ({num_doors} Doors)')
     plt.ylim(0, 1)
     plt.show()
 
-def interactive_menu():
+def interactive_menu(exact=False, seed=0):
     """Displays the interactive console menu."""
+    # Menu choice -> number of doors to simulate.
+    door_choices = {'1': 3, '2': 10, '3': 1000}
     while True:
         print("\nMonty Hall Simulation Menu:")
         print("1. Run the problem with 3 doors")
@@ -69,12 +215,8 @@ def interactive_menu():
 
         choice = input("Enter your choice (1-4): ")
 
-        if choice == '1':
-            run_simulation(3)
-        elif choice == '2':
-            run_simulation(10)
-        elif choice == '3':
-            run_simulation(1000)
+        if choice in door_choices:
+            run_simulation(door_choices[choice], exact=exact, seed=seed)
         elif choice == '4':
             break
         else:
@@ -84,13 +226,15 @@ def interactive_menu():
 def main():
     parser = argparse.ArgumentParser(description="Monty Hall Problem Simulation")
     parser.add_argument("-i", "--interactive", action="store_true", help="Run in interactive mode")
+    parser.add_argument("--analytic", action="store_true", help="Plot the exact win rates instead of simulating")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the simulation (default: 0)")
     args = parser.parse_args()
 
     if args.interactive:
-        interactive_menu()
+        interactive_menu(exact=args.analytic, seed=args.seed)
     else:
        #default behaviour, 3 doors
-        run_simulation(3)
+        run_simulation(3, exact=args.analytic, seed=args.seed)
 
 
 
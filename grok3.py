@@ -16,13 +16,100 @@ Dependencies:
 - Python 3.6 or higher
 - `random` package (built-in)
 - `matplotlib` package (install with `pip install matplotlib`)
+- `numpy` package (optional, install with `pip install numpy`)
+- `numba` package (optional, install with `pip install numba`)
+- `cupy` package (optional, for large runs on an NVIDIA GPU; see https://cupy.dev)
 """
 
 import random
-import matplotlib.pyplot as plt
 import argparse
+import multiprocessing
+import os
+import functools
 
-def monty_hall_simulation(num_doors, num_trials, switch_doors):
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure-Python loop.
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to the NumPy or pure-Python path.
+    njit = None
+
+try:
+    import cupy as cp
+except ImportError:  # CuPy is optional; large runs stay on the CPU paths.
+    cp = None
+
+# Unseeded runs all draw from this generator instead of seeding a new one from OS entropy per call.
+_RNG = np.random.default_rng(np.random.SeedSequence()) if np is not None else None
+GPU_MIN_TRIALS = 1_000_000  # Below this, kernel launches and transfers cost more than the GPU saves.
+PARALLEL_MIN_TRIALS = 200_000  # Below this, starting worker processes costs more than the Python loop.
+KERNEL_CHUNKS = 64  # Fixed chunks, each seeded on its own, keep seeded kernel runs repeatable across core counts.
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _monty_kernel(num_trials, num_doors, switch_doors, seed):
+        """Counts the wins over num_trials games in compiled code, spread across all cores.
+
+        Each of the KERNEL_CHUNKS chunks reseeds its thread's generator from seed, so the
+        count depends only on seed, not on how many threads ran it.
+        """
+        wins = 0
+        for chunk in prange(KERNEL_CHUNKS):
+            np.random.seed((seed * KERNEL_CHUNKS + chunk) & 0xFFFFFFFF)
+            chunk_wins = 0
+            for _ in range(num_trials // KERNEL_CHUNKS + (chunk < num_trials % KERNEL_CHUNKS)):
+                car_door = np.random.randint(0, num_doors)
+                player_choice = np.random.randint(0, num_doors)
+                # XOR turns a stay win into a switch loss (and vice versa) without branching.
+                chunk_wins += np.int64(player_choice == car_door) ^ np.int64(switch_doors)
+            wins += chunk_wins
+        return wins
+else:
+    _monty_kernel = None
+
+def _door_pairs(rng, num_doors, num_trials):
+    """
+    Draw the car door and first pick of num_trials games, stored in the smallest signed
+    integer type that can hold every door so large runs move less memory.
+    """
+    if num_doors <= 127:
+        dtype = np.int8
+    elif num_doors <= 32767:
+        dtype = np.int16
+    else:
+        dtype = np.int32
+    car_doors, player_choices = rng.integers(0, num_doors, size=(2, num_trials), dtype=dtype)
+    return car_doors, player_choices
+
+def _loop_wins(num_doors, num_trials, switch_doors, seed):
+    """Play num_trials games with the plain Python loop and return the number of wins."""
+    # Draw from a generator of our own, so a seed never resets the global random module.
+    randrange = random.Random(seed).randrange
+
+    wins = 0
+    for _ in range(num_trials):
+        car_door = randrange(num_doors)
+        player_choice = randrange(num_doors)
+        
+        # Monty reveals all but one door, excluding player's choice and car.
+        # The door he leaves closed is the car, or a random goat if the player holds the car,
+        # so it can be drawn directly instead of sampling the num_doors - 2 reveals.
+        if switch_doors:
+            if player_choice != car_door:
+                player_choice = car_door
+            else:
+                other_door = randrange(num_doors - 1)
+                player_choice = other_door + (other_door >= player_choice)
+            
+        if player_choice == car_door:
+            wins += 1
+            
+    return wins
+
+def monty_hall_simulation(num_doors, num_trials, switch_doors, seed=None):
     """
     Simulates the Monty Hall problem for a specified number of doors and trials.
 
@@ -30,32 +117,89 @@ def monty_hall_simulation(num_doors, num_trials, switch_doors):
         num_doors (int): Number of doors in the simulation
         num_trials (int): The number of times to run the simulation
         switch_doors (bool): Whether the player switches doors after Monty's reveal
+        seed (int, optional): Seed for the random number generator
 
     Returns:
         float: The win rate (number of wins / total trials)
     """
-    wins = 0
-    for _ in range(num_trials):
-        car_door = random.randint(0, num_doors - 1)
-        player_choice = random.randint(0, num_doors - 1)
-        
-        # Monty reveals all but one door, excluding player's choice and car
-        available_to_open = [i for i in range(num_doors) if i != car_door and i != player_choice]
-        monty_reveals = random.sample(available_to_open, num_doors - 2)
-        
+    if cp is not None and num_trials >= GPU_MIN_TRIALS:
+        # Play every game on the GPU; only the final count comes back to the host.
+        gpu_rng = cp.random.default_rng(seed)
+        car_doors = gpu_rng.integers(0, num_doors, size=num_trials, dtype=cp.int32)
+        player_choices = gpu_rng.integers(0, num_doors, size=num_trials, dtype=cp.int32)
         if switch_doors:
-            remaining_doors = [i for i in range(num_doors) if i != player_choice and i not in monty_reveals]
-            player_choice = remaining_doors[0]
-            
-        if player_choice == car_door:
-            wins += 1
-            
+            return int(cp.count_nonzero(player_choices != car_doors)) / num_trials
+        return int(cp.count_nonzero(player_choices == car_doors)) / num_trials
+
+    if _monty_kernel is not None:
+        # The kernel always takes a seed; without one, fall back to OS entropy.
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little")
+        return _monty_kernel(num_trials, num_doors, switch_doors, seed) / num_trials
+
+    if np is not None:
+        # Draw every trial at once instead of looping in Python. Monty leaves only
+        # one other door closed, so switching wins exactly when the first pick was wrong.
+        rng = _RNG if seed is None else np.random.default_rng(seed)
+        car_doors, player_choices = _door_pairs(rng, num_doors, num_trials)
+        if switch_doors:
+            return np.count_nonzero(player_choices != car_doors) / num_trials
+        return np.count_nonzero(player_choices == car_doors) / num_trials
+
+    processes = os.cpu_count() or 1
+    if num_trials < PARALLEL_MIN_TRIALS or processes == 1:
+        return _loop_wins(num_doors, num_trials, switch_doors, seed) / num_trials
+
+    # Without NumPy the loop is CPU-bound, so spread it over every core; each chunk
+    # gets its own seed so the workers do not replay the same games.
+    seeder = random.Random(seed)
+    chunks = [(num_doors, num_trials // processes + (chunk < num_trials % processes), switch_doors, seeder.randrange(2 ** 32))
+              for chunk in range(processes)]
+    with multiprocessing.Pool(processes) as pool:
+        wins = sum(pool.starmap(_loop_wins, chunks))
     return wins / num_trials
 
-def run_simulation(num_doors, num_trials):
+def monty_hall_rates(num_doors, num_trials, seed=None):
+    """
+    Simulates the game once and scores both strategies on the same games.
+
+    Args:
+        num_doors (int): Number of doors in the simulation
+        num_trials (int): The number of times to run the simulation
+        seed (int, optional): Seed for the random number generator
+
+    Returns:
+        tuple: The win rates for staying and for switching.
+    """
+    stay_win_rate = monty_hall_simulation(num_doors, num_trials, False, seed)
+    # Monty leaves a single other door closed, so switching wins exactly the games staying loses.
+    return stay_win_rate, 1.0 - stay_win_rate
+
+@functools.lru_cache(maxsize=32)
+def _cached_rates(num_doors, num_trials, seed):
+    """Cache seeded win rates so repeated menu choices skip the simulation."""
+    return monty_hall_rates(num_doors, num_trials, seed)
+
+def monty_hall_analytic(num_doors):
+    """
+    Compute the exact win rates for a given number of doors.
+
+    Args:
+        num_doors (int): Number of doors in the game
+
+    Returns:
+        tuple: The exact win rates for staying and for switching.
+    """
+    return 1.0 / num_doors, (num_doors - 1) / num_doors
+
+def run_simulation(num_doors, num_trials, exact=False, seed=0):
     """Run simulation and display results for given number of doors."""
-    switch_win_rate = monty_hall_simulation(num_doors, num_trials, True)
-    stay_win_rate = monty_hall_simulation(num_doors, num_trials, False)
+    if exact:
+        stay_win_rate, switch_win_rate = monty_hall_analytic(num_doors)
+    elif seed is None:
+        stay_win_rate, switch_win_rate = monty_hall_rates(num_doors, num_trials)
+    else:
+        stay_win_rate, switch_win_rate = _cached_rates(num_doors, num_trials, seed)
 
     # Print results
     print(f"\nResults for {num_doors} doors ({num_trials} trials):")
@@ -66,15 +210,17 @@ def run_simulation(num_doors, num_trials):
     labels = ['Switch Doors', 'Stay with Original Choice']
     win_rates = [switch_win_rate, stay_win_rate]
     
+    import matplotlib.pyplot as plt  # Imported here so the simulation itself never loads matplotlib
     plt.bar(labels, win_rates, color=['blue', 'red'])
     plt.ylabel('Win Rate')
     plt.title(f'Monty Hall Simulation Results\n{num_doors} Doors, {num_trials} Trials')
     plt.ylim(0, 1)
     plt.show()
 
-def interactive_menu():
+def interactive_menu(exact=False, seed=0):
     """Display interactive menu for simulation options."""
     num_trials = 10000  # Default number of trials
+    door_options = {'1': 3, '2': 10, '3': 1000}  # Menu choice -> number of doors
     
     while True:
         print("\nMonty Hall Simulation Menu")
@@ -85,12 +231,8 @@ def interactive_menu():
         
         choice = input("Enter your choice (1-4): ")
         
-        if choice == '1':
-            run_simulation(3, num_trials)
-        elif choice == '2':
-            run_simulation(10, num_trials)
-        elif choice == '3':
-            run_simulation(1000, num_trials)
+        if choice in door_options:
+            run_simulation(door_options[choice], num_trials, exact=exact, seed=seed)
         elif choice == '4':
             print("Exiting...")
             break
@@ -102,12 +244,16 @@ def main():
     parser = argparse.ArgumentParser(description="Monty Hall Problem Simulator")
     parser.add_argument('-i', '--interactive', action='store_true',
                        help='Run in interactive mode')
+    parser.add_argument('--analytic', action='store_true',
+                       help='Plot the exact win rates instead of simulating')
+    parser.add_argument('--seed', type=int, default=0,
+                       help='Seed for the simulation (default: 0)')
     args = parser.parse_args()
     
     if args.interactive:
-        interactive_menu()
+        interactive_menu(exact=args.analytic, seed=args.seed)
     else:
-        run_simulation(3, 10000)
+        run_simulation(3, 10000, exact=args.analytic, seed=args.seed)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
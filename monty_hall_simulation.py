@@ -15,45 +15,133 @@ Run the script with the following command:
     python monty_hall_simulation.py          # Run with default 3 doors
     python monty_hall_simulation.py -i       # Run in interactive mode
     python monty_hall_simulation.py --interactive  # Run in interactive mode
+    python monty_hall_simulation.py --analytic     # Plot the exact win percentages
 
 Dependencies:
 - Python 3.6 or higher
 - `random` package (built-in)
 - `matplotlib` package (install with `pip install matplotlib`)
+- `numpy` package (optional, install with `pip install numpy`)
+- `numba` package (optional, install with `pip install numba`)
+- `cupy` package (optional, for large runs on an NVIDIA GPU; see https://cupy.dev)
 - `argparse` package (built-in)
 """
 
 import random
-import matplotlib.pyplot as plt
 import argparse
+import functools
+import multiprocessing
+import os
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure-Python loop.
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to the NumPy or pure-Python path.
+    njit = None
+
+try:
+    import cupy as cp
+except ImportError:  # CuPy is optional; large runs stay on the CPU paths.
+    cp = None
+
+# Generator shared by unseeded runs, seeded once from OS entropy rather than on every call.
+_RNG = np.random.default_rng(np.random.SeedSequence()) if np is not None else None
+GPU_MIN_TRIALS = 1_000_000  # Below this, kernel launches and transfers cost more than the GPU saves.
+PARALLEL_MIN_TRIALS = 200_000  # Below this, starting worker processes costs more than the Python loop.
+KERNEL_CHUNKS = 64  # Fixed chunks, each seeded on its own, keep seeded kernel runs repeatable across core counts.
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _monty_kernel(num_trials, num_doors, seed):
+        """Counts the (stay, switch) wins over num_trials games in compiled code, spread across all cores.
+
+        Each of the KERNEL_CHUNKS chunks reseeds its thread's generator from seed, so the
+        counts depend only on seed, not on how many threads ran them.
+        """
+        stay_wins = 0
+        switch_wins = 0
+        for chunk in prange(KERNEL_CHUNKS):
+            np.random.seed((seed * KERNEL_CHUNKS + chunk) & 0xFFFFFFFF)
+            chunk_stay = 0
+            chunk_switch = 0
+            for _ in range(num_trials // KERNEL_CHUNKS + (chunk < num_trials % KERNEL_CHUNKS)):
+                winning_door = np.random.randint(0, num_doors)
+                player_choice = np.random.randint(0, num_doors)
+                stayed = np.int64(player_choice == winning_door)
+                chunk_stay += stayed
+                # A wrong first pick leaves the prize among the num_doors - 2 doors to switch to.
+                chunk_switch += (stayed ^ 1) & np.int64(np.random.random() * (num_doors - 2) < 1.0)
+            stay_wins += chunk_stay
+            switch_wins += chunk_switch
+        return stay_wins, switch_wins
+else:
+    _monty_kernel = None
+
+def _door_pairs(rng, num_doors, num_trials):
+    """
+    Draws the winning door and first pick of each trial in the smallest integer type that fits.
+
+    Args:
+        rng (numpy.random.Generator): The generator to draw from.
+        num_doors (int): The number of doors in the simulation.
+        num_trials (int): The number of trials to draw.
+
+    Returns:
+        tuple: The winning doors and the player's first picks, as int8, int16 or int32 arrays.
+    """
+    if num_doors <= 127:
+        dtype = np.int8
+    elif num_doors <= 32767:
+        dtype = np.int16
+    else:
+        dtype = np.int32
+    winning_doors, player_choices = rng.integers(0, num_doors, size=(2, num_trials), dtype=dtype)
+    return winning_doors, player_choices
 
-def run_simulation(num_doors=3, num_trials=10000):
+def random_door_except(num_doors, *excluded_doors, randrange=random.randrange):
     """
-    Runs the Monty Hall simulation.
+    Picks a random door other than the excluded ones, without listing the doors.
 
     Args:
         num_doors (int): The number of doors in the simulation.
-        num_trials (int): The number of trials to run.
+        *excluded_doors (int): The doors to skip.
+        randrange (callable, optional): The randrange to draw with (default: random.randrange).
 
     Returns:
-        tuple: A tuple containing the win percentages for switching and not switching.
+        int: The picked door.
     """
+    excluded_doors = sorted(set(excluded_doors))
+    door = randrange(num_doors - len(excluded_doors))
+    # Step over the excluded doors so every allowed door is equally likely.
+    for excluded_door in excluded_doors:
+        if door >= excluded_door:
+            door += 1
+    return door
+
+def _loop_wins(num_doors, num_trials, seed):
+    """Plays num_trials games with the pure-Python loop and returns the (switch, stay) win counts."""
+    # Use a local generator so a seeded run leaves the global random state as it was.
+    randrange = random.Random(seed).randrange
+
     switch_wins = 0
     stay_wins = 0
 
     for _ in range(num_trials):
         # Randomly choose the door with the prize
-        winning_door = random.randint(0, num_doors - 1)
+        winning_door = randrange(num_doors)
 
         # Player makes an initial choice
-        player_choice = random.randint(0, num_doors - 1)
+        player_choice = randrange(num_doors)
 
         # Host opens a door that is not the winning door and not the player's choice
-        available_doors = [i for i in range(num_doors) if i != winning_door and i != player_choice]
-        host_choice = random.choice(available_doors)
+        host_choice = random_door_except(num_doors, winning_door, player_choice, randrange=randrange)
 
-        # Player switches to the remaining door
-        switch_choice = [i for i in range(num_doors) if i != player_choice and i != host_choice][0]
+        # Player switches to one of the remaining doors
+        switch_choice = random_door_except(num_doors, player_choice, host_choice, randrange=randrange)
 
         # Determine if the player won by switching
         if switch_choice == winning_door:
@@ -63,6 +151,74 @@ def run_simulation(num_doors=3, num_trials=10000):
         if player_choice == winning_door:
             stay_wins += 1
 
+    return switch_wins, stay_wins
+
+
+def run_simulation(num_doors=3, num_trials=10000, seed=0):
+    """
+    Runs the Monty Hall simulation.
+
+    Args:
+        num_doors (int): The number of doors in the simulation.
+        num_trials (int): The number of trials to run.
+        seed (int, optional): Seed for the random number generator. Seeded results are
+            cached; pass None for a fresh run.
+
+    Returns:
+        tuple: A tuple containing the win percentages for switching and not switching.
+    """
+    if seed is None:
+        return _simulate(num_doors, num_trials, None)
+    return _cached_simulation(num_doors, num_trials, seed)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_simulation(num_doors, num_trials, seed):
+    """Memoizes the percentages of seeded runs, which always come out the same."""
+    return _simulate(num_doors, num_trials, seed)
+
+
+def _simulate(num_doors, num_trials, seed):
+    """Plays num_trials games and returns the (switch, stay) win percentages."""
+    if cp is not None and num_trials >= GPU_MIN_TRIALS:
+        # Large runs are independent elementwise draws, so the GPU plays them all at once.
+        gpu_rng = cp.random.default_rng(seed)
+        winning_doors = gpu_rng.integers(0, num_doors, size=num_trials, dtype=cp.int32)
+        player_choices = gpu_rng.integers(0, num_doors, size=num_trials, dtype=cp.int32)
+        stayed = player_choices == winning_doors
+        lucky_switch = gpu_rng.random(num_trials) < 1 / (num_doors - 2)
+        switch_wins = int(cp.count_nonzero(~stayed & lucky_switch))
+        stay_wins = int(cp.count_nonzero(stayed))
+    elif _monty_kernel is not None:
+        # The kernel seeds each chunk from seed; unseeded runs draw one from the OS.
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little")
+        stay_wins, switch_wins = _monty_kernel(num_trials, num_doors, seed)
+    elif np is not None:
+        # Draw every trial at once instead of looping in Python.
+        rng = _RNG if seed is None else np.random.default_rng(seed)
+        winning_doors, player_choices = _door_pairs(rng, num_doors, num_trials)
+        stayed = player_choices == winning_doors
+        # After the host opens one door, num_doors - 2 doors are left to switch to; the switch
+        # can only find the prize if the first pick was wrong, and then 1 time in num_doors - 2.
+        lucky_switch = rng.random(num_trials) < 1 / (num_doors - 2)
+        switch_wins = np.count_nonzero(~stayed & lucky_switch)
+        stay_wins = np.count_nonzero(stayed)
+    else:
+        processes = os.cpu_count() or 1
+        if num_trials < PARALLEL_MIN_TRIALS or processes == 1:
+            switch_wins, stay_wins = _loop_wins(num_doors, num_trials, seed)
+        else:
+            # Without NumPy the loop is the bottleneck, so run a share of it on every core,
+            # giving each share its own seed so no two workers play the same games.
+            seeder = random.Random(seed)
+            chunks = [(num_doors, num_trials // processes + (chunk < num_trials % processes), seeder.randrange(2 ** 32))
+                      for chunk in range(processes)]
+            with multiprocessing.Pool(processes) as pool:
+                results = pool.starmap(_loop_wins, chunks)
+            switch_wins = sum(switch for switch, _ in results)
+            stay_wins = sum(stay for _, stay in results)
+
     # Calculate win percentages
     switch_win_percentage = (switch_wins / num_trials) * 100
     stay_win_percentage = (stay_wins / num_trials) * 100
@@ -70,6 +226,24 @@ def run_simulation(num_doors=3, num_trials=10000):
     return switch_win_percentage, stay_win_percentage
 
 
+def monty_hall_analytic(num_doors=3):
+    """
+    Computes the exact win percentages when the host opens a single door.
+
+    Args:
+        num_doors (int): The number of doors in the game.
+
+    Returns:
+        tuple: A tuple containing the win percentages for switching and not switching.
+    """
+    # Staying wins 1 time in num_doors. Otherwise the prize is behind one of the
+    # num_doors - 2 doors left to switch to.
+    switch_win_percentage = (num_doors - 1) / (num_doors * (num_doors - 2)) * 100
+    stay_win_percentage = 1 / num_doors * 100
+
+    return switch_win_percentage, stay_win_percentage
+
+
 def plot_results(switch_win_percentage, stay_win_percentage):
     """
     Plots the results of the Monty Hall simulation.
@@ -81,6 +255,7 @@ def plot_results(switch_win_percentage, stay_win_percentage):
     labels = ['Switch', 'Stay']
     win_percentages = [switch_win_percentage, stay_win_percentage]
 
+    import matplotlib.pyplot as plt  # Imported here so the simulation itself never loads matplotlib
     plt.bar(labels, win_percentages, color=['blue', 'green'])
     plt.ylabel('Win Percentage')
     plt.title('Monty Hall Problem Simulation Results')
@@ -94,9 +269,17 @@ def main():
     """
     parser = argparse.ArgumentParser(description="Simulate the Monty Hall problem.")
     parser.add_argument("-i", "--interactive", action="store_true", help="Run in interactive mode.")
+    parser.add_argument("--analytic", action="store_true", help="Plot the exact win percentages instead of simulating.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the simulation (default: 0).")
     args = parser.parse_args()
+    # Both return (switch, stay) percentages, so the menu below can use either one.
+    if args.analytic:
+        simulate = monty_hall_analytic
+    else:
+        simulate = functools.partial(run_simulation, seed=args.seed)
 
     if args.interactive:
+        door_choices = {'1': 3, '2': 10, '3': 1000}  # Menu choice -> number of doors
         while True:
             print("\nMonty Hall Problem Simulation")
             print("1. Run with 3 doors")
@@ -106,19 +289,14 @@ def main():
 
             choice = input("Enter your choice (1-4): ")
 
-            if choice == '1':
-                num_doors = 3
-            elif choice == '2':
-                num_doors = 10
-            elif choice == '3':
-                num_doors = 1000
-            elif choice == '4':
+            if choice == '4':
                 break
-            else:
+            if choice not in door_choices:
                 print("Invalid choice. Please enter a number between 1 and 4.")
                 continue
+            num_doors = door_choices[choice]
 
-            switch_win_percentage, stay_win_percentage = run_simulation(num_doors=num_doors)
+            switch_win_percentage, stay_win_percentage = simulate(num_doors=num_doors)
 
             print(f"\nMonty Hall Simulation Results ({num_doors} doors):")
             print(f"Switching win percentage: {switch_win_percentage:.2f}%")
@@ -126,7 +304,7 @@ def main():
 
             plot_results(switch_win_percentage, stay_win_percentage)
     else:
-        switch_win_percentage, stay_win_percentage = run_simulation()
+        switch_win_percentage, stay_win_percentage = simulate()
 
         print("\nMonty Hall Simulation Results (3 doors):")
         print(f"Switching win percentage: {switch_win_percentage:.2f}%")
@@ -0,0 +1,14 @@
+"""
+Builds the optional `_monty` C extension used by the simulation scripts.
+
+Usage:
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="monty-hall-problem",
+    ext_modules=cythonize("_monty.pyx"),
+)
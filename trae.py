@@ -1,9 +1,96 @@
 import random
-import matplotlib.pyplot as plt
 import argparse
+import multiprocessing
+import functools
 import os
 
-def monty_hall_simulation(num_trials, switch_doors, num_doors=3):
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure-Python loop.
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to the NumPy or pure-Python path.
+    njit = None
+
+try:
+    import cupy as cp
+except ImportError:  # CuPy is optional; large runs stay on the CPU paths.
+    cp = None
+
+# Shared PCG64 generator for unseeded runs, so each call skips gathering fresh OS entropy.
+_RNG = np.random.default_rng(np.random.SeedSequence()) if np is not None else None
+GPU_MIN_TRIALS = 1_000_000  # Below this, kernel launches and transfers cost more than the GPU saves.
+PARALLEL_MIN_TRIALS = 200_000  # Below this, starting worker processes costs more than the Python loop.
+KERNEL_CHUNKS = 64  # Fixed chunks, each seeded on its own, keep seeded kernel runs repeatable across core counts.
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _monty_kernel(num_trials, num_doors, switch_doors, seed):
+        """Counts the wins over num_trials games in compiled code, spread across all cores.
+
+        Each of the KERNEL_CHUNKS chunks reseeds its thread's generator from seed, so the
+        count depends only on seed, not on how many threads ran it.
+        """
+        wins = 0
+        for chunk in prange(KERNEL_CHUNKS):
+            np.random.seed((seed * KERNEL_CHUNKS + chunk) & 0xFFFFFFFF)
+            chunk_wins = 0
+            for _ in range(num_trials // KERNEL_CHUNKS + (chunk < num_trials % KERNEL_CHUNKS)):
+                car_door = np.random.randint(0, num_doors)
+                player_choice = np.random.randint(0, num_doors)
+                # XOR turns a stay win into a switch loss (and vice versa) without branching.
+                chunk_wins += np.int64(player_choice == car_door) ^ np.int64(switch_doors)
+            wins += chunk_wins
+        return wins
+else:
+    _monty_kernel = None
+
+def _door_pairs(rng, num_doors, num_trials):
+    """
+    Draws the car door and first pick of num_trials games in one call.
+
+    The doors are stored as int8 when they fit (int16, then int32 otherwise), so the
+    3- and 10-door games use a single byte per door.
+    """
+    if num_doors <= 127:
+        dtype = np.int8
+    elif num_doors <= 32767:
+        dtype = np.int16
+    else:
+        dtype = np.int32
+    car_doors, player_choices = rng.integers(0, num_doors, size=(2, num_trials), dtype=dtype)
+    return car_doors, player_choices
+
+def _loop_wins(num_trials, switch_doors, num_doors, seed):
+    """Counts the wins over num_trials games with the pure-Python loop (one process)."""
+    # Private generator, bound once: seeding it does not touch the caller's random state.
+    randrange = random.Random(seed).randrange
+
+    wins = 0
+    for _ in range(num_trials):
+        car_door = randrange(num_doors)
+        player_choice = randrange(num_doors)
+
+        # Monty reveals all doors except one (if switching) or none (if staying).
+        # He never opens the car, so the door left closed is the car when the player
+        # missed it, otherwise one of the goats.
+        if switch_doors:
+            if car_door != player_choice:
+                player_choice = car_door
+            else:
+                # Draw among the other doors and step past the player's door,
+                # instead of building a set of every door each trial.
+                other_door = randrange(num_doors - 1)
+                player_choice = other_door + (other_door >= player_choice)
+
+        if player_choice == car_door:
+            wins += 1
+
+    return wins
+
+def monty_hall_simulation(num_trials, switch_doors, num_doors=3, seed=None):
     """
     Simulates the Monty Hall problem for a specified number of trials and doors.
 
@@ -11,39 +98,90 @@ def monty_hall_simulation(num_trials, switch_doors, num_doors=3):
         num_trials (int): The number of times to run the simulation.
         switch_doors (bool): Whether the player switches doors after Monty's reveal.
         num_doors (int): The number of doors in the game (default: 3).
+        seed (int, optional): Seed for the random number generator (default: None).
 
     Returns:
         float: The win rate (number of wins / total trials).
     """
-    wins = 0
-    for _ in range(num_trials):
-        car_door = random.randint(0, num_doors - 1)
-        player_choice = random.randint(0, num_doors - 1)
-
-        # Monty reveals all but one door (excluding the player's choice and car door)
-        available_doors = set(range(num_doors))
-        available_doors.remove(player_choice)
-        if car_door != player_choice:
-            available_doors.remove(car_door)
-        
-        # Monty reveals all doors except one (if switching) or none (if staying)
+    if cp is not None and num_trials >= GPU_MIN_TRIALS:
+        # Large runs are plain elementwise work, which the GPU does far faster than the CPU.
+        gpu_rng = cp.random.default_rng(seed)
+        car_doors = gpu_rng.integers(0, num_doors, size=num_trials, dtype=cp.int32)
+        player_choices = gpu_rng.integers(0, num_doors, size=num_trials, dtype=cp.int32)
         if switch_doors:
-            remaining_doors = [i for i in available_doors if i != car_door]
-            for door in remaining_doors[:-1]:
-                available_doors.remove(door)
-            # Switch to the only remaining door
-            player_choice = list(available_doors - {player_choice})[0]
+            return int(cp.count_nonzero(player_choices != car_doors)) / num_trials
+        return int(cp.count_nonzero(player_choices == car_doors)) / num_trials
 
-        if player_choice == car_door:
-            wins += 1
+    if _monty_kernel is not None:
+        # Seeded runs repeat exactly; unseeded ones get a fresh seed from the OS.
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little")
+        return _monty_kernel(num_trials, num_doors, switch_doors, seed) / num_trials
+
+    if np is not None:
+        # Draw every trial at once instead of looping in Python. Monty leaves only
+        # one other door closed, so switching wins exactly when the first pick was wrong.
+        rng = _RNG if seed is None else np.random.default_rng(seed)
+        car_doors, player_choices = _door_pairs(rng, num_doors, num_trials)
+        if switch_doors:
+            return np.count_nonzero(player_choices != car_doors) / num_trials
+        return np.count_nonzero(player_choices == car_doors) / num_trials
+
+    processes = os.cpu_count() or 1
+    if num_trials < PARALLEL_MIN_TRIALS or processes == 1:
+        return _loop_wins(num_trials, switch_doors, num_doors, seed) / num_trials
 
+    # Split the trials across processes, giving each chunk its own seed so the
+    # workers do not replay the same games.
+    seeder = random.Random(seed)
+    chunks = [(num_trials // processes + (chunk < num_trials % processes), switch_doors, num_doors, seeder.randrange(2 ** 32))
+              for chunk in range(processes)]
+    with multiprocessing.Pool(processes) as pool:
+        wins = sum(pool.starmap(_loop_wins, chunks))
     return wins / num_trials
 
-def run_simulation(num_doors, save_path=None):
+def monty_hall_rates(num_trials, num_doors=3, seed=None):
+    """
+    Simulates the game once and scores both strategies on the same games.
+
+    Args:
+        num_trials (int): The number of times to run the simulation.
+        num_doors (int): The number of doors in the game (default: 3).
+        seed (int, optional): Seed for the random number generator (default: None).
+
+    Returns:
+        tuple: The win rates for staying and for switching.
+    """
+    stay_win_rate = monty_hall_simulation(num_trials, False, num_doors, seed)
+    # Monty leaves a single other door closed, so switching wins exactly the games staying loses.
+    return stay_win_rate, 1.0 - stay_win_rate
+
+@functools.lru_cache(maxsize=32)
+def _cached_rates(num_doors, num_trials, seed):
+    """Memoizes seeded win rates, so "Run all simulations" only redraws the graphs on repeat."""
+    return monty_hall_rates(num_trials, num_doors, seed)
+
+def monty_hall_analytic(num_doors=3):
+    """
+    Computes the exact win rates; switching wins whenever the first pick was wrong.
+
+    Args:
+        num_doors (int): The number of doors in the game (default: 3).
+
+    Returns:
+        tuple: The exact win rates for staying and for switching.
+    """
+    return 1.0 / num_doors, (num_doors - 1) / num_doors
+
+def run_simulation(num_doors, save_path=None, exact=False, seed=0, ax=None):
     """Run the simulation for a specific number of doors and display results."""
     num_trials = 10000
-    switch_win_rate = monty_hall_simulation(num_trials, True, num_doors)
-    stay_win_rate = monty_hall_simulation(num_trials, False, num_doors)
+    if exact:
+        stay_win_rate, switch_win_rate = monty_hall_analytic(num_doors)
+    elif seed is None:
+        stay_win_rate, switch_win_rate = monty_hall_rates(num_trials, num_doors)
+    else:
+        stay_win_rate, switch_win_rate = _cached_rates(num_doors, num_trials, seed)
 
     print(f"\nResults for {num_doors} doors:")
     print(f"Win rate when switching doors: {switch_win_rate:.4f}")
@@ -52,34 +190,51 @@ def run_simulation(num_doors, save_path=None):
     labels = ['Switch Doors', 'Stay with Original Choice']
     win_rates = [switch_win_rate, stay_win_rate]
 
-    plt.figure()
-    plt.bar(labels, win_rates, color=['blue', 'red'])
-    plt.ylabel('Win Rate')
-    plt.title(f'Monty Hall Simulation Results\n(Trae AI) ({num_doors} doors)')
-    plt.ylim(0, 1)
+    interactive = ax is None
+    if interactive:
+        import matplotlib.pyplot as plt  # Imported here so the simulation itself never loads matplotlib
+        ax = plt.figure().gca()
+    else:
+        ax.clear()
+    ax.bar(labels, win_rates, color=['blue', 'red'])
+    ax.set_ylabel('Win Rate')
+    ax.set_title(f'Monty Hall Simulation Results\n(Trae AI) ({num_doors} doors)')
+    ax.set_ylim(0, 1)
     
     if save_path:
-        plt.savefig(save_path)
-    plt.show()
-    plt.close()
+        ax.figure.savefig(save_path)
+    if interactive:
+        plt.show()
+        plt.close()
 
-def run_all_simulations():
+def run_all_simulations(exact=False, seed=0):
     """Runs all simulations and saves the graphs."""
     images_dir = '/Users/wleon/Dropbox/_Back2Bits/TheMontyHallProblem/images'
     os.makedirs(images_dir, exist_ok=True)
     
+    from matplotlib.figure import Figure
+
     configurations = [
         (3, 'trae_3_doors.jpg'),
         (10, 'trae_10_doors.jpg'),
         (1000, 'trae_1000_doors.jpg')
     ]
     
+    # Only the files are wanted here, so redraw one off-screen Agg figure for every
+    # configuration instead of opening (and blocking on) a window for each.
+    ax = Figure().subplots()
     for num_doors, filename in configurations:
         save_path = os.path.join(images_dir, filename)
-        run_simulation(num_doors, save_path)
+        run_simulation(num_doors, save_path, exact=exact, seed=seed, ax=ax)
 
-def display_menu():
+def display_menu(exact=False, seed=0):
     """Display the interactive menu and handle user input."""
+    actions = {
+        '1': lambda: run_simulation(3, exact=exact, seed=seed),
+        '2': lambda: run_simulation(10, exact=exact, seed=seed),
+        '3': lambda: run_simulation(1000, exact=exact, seed=seed),
+        '4': lambda: run_all_simulations(exact=exact, seed=seed),
+    }
     while True:
         print("\nMonty Hall Problem Simulator")
         print("1. Run simulation with 3 doors")
@@ -90,17 +245,12 @@ def display_menu():
         
         choice = input("\nEnter your choice (1-5): ")
         
-        if choice == '1':
-            run_simulation(3)
-        elif choice == '2':
-            run_simulation(10)
-        elif choice == '3':
-            run_simulation(1000)
-        elif choice == '4':
-            run_all_simulations()
-        elif choice == '5':
+        if choice == '5':
             print("Goodbye!")
             break
+        action = actions.get(choice)
+        if action:
+            action()
         else:
             print("Invalid choice. Please try again.")
 
@@ -108,13 +258,17 @@ def main():
     parser = argparse.ArgumentParser(description='Monty Hall Problem Simulator')
     parser.add_argument('-i', '--interactive', action='store_true',
                         help='Run in interactive mode with a menu')
+    parser.add_argument('--analytic', action='store_true',
+                        help='Plot the exact win rates instead of simulating')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed for the simulation, so runs can be repeated (default: 0)')
     args = parser.parse_args()
 
     if args.interactive:
-        display_menu()
+        display_menu(exact=args.analytic, seed=args.seed)
     else:
         # Run the classic 3-door version by default
-        run_simulation(3)
+        run_simulation(3, exact=args.analytic, seed=args.seed)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file